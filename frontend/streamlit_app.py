@@ -11,11 +11,32 @@ Password protected for authorized access only.
 import streamlit as st
 import json
 import base64
+import functools
+import hashlib
+import hmac
+import itertools
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Callable, Iterator, Optional, Tuple, Union
 import os
+import uuid
+import pandas as pd
 import requests
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pybase64
+except ImportError:
+    pybase64 = None
+
+from utils.api_client import create_http_session, json_loads, parse_scoring_response
+from utils.parsing import parse_keywords, parse_iso_datetime
+
 # =============================================================================
 # PAGE CONFIGURATION
 # =============================================================================
@@ -31,7 +52,7 @@ st.set_page_config(
 # CUSTOM STYLING
 # =============================================================================
 
-st.markdown("""
+APP_CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -83,7 +104,48 @@ st.markdown("""
         font-size: 1.2rem;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Streamlit rebuilds the element tree on every rerun, so the style block has
+# to be emitted each time; only the string itself is built once.
+st.markdown(APP_CSS, unsafe_allow_html=True)
+
+# =============================================================================
+# ENCODING HELPERS
+# =============================================================================
+
+def b64encode_text(data: Union[bytes, memoryview]) -> str:
+    """Base64-encode binary data to text, using SIMD pybase64 when it is installed."""
+    if pybase64 is not None:
+        return pybase64.b64encode_as_string(data)
+    return base64.b64encode(data).decode("ascii")
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Serialize to compact JSON bytes for request bodies."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def json_dumps_pretty(obj: Any) -> bytes:
+    """Serialize to indented JSON bytes, ready for st.download_button."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+@st.cache_data(max_entries=4, ttl=600, show_spinner=False)
+def serialize_download(response_id: str, _response: Dict) -> bytes:
+    """Serialize a response for download once per response_id, reused across reruns."""
+    return json_dumps_pretty(_response)
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def count_opportunities(file_id: str, _json_content: bytes) -> int:
+    """Validate an opportunities JSON file and count its entries, once per uploaded file."""
+    return len(json_loads(_json_content).get("opportunities", []))
+
 
 # =============================================================================
 # API CLIENTS
@@ -99,25 +161,23 @@ class OpportunityScoutClient:
             self.scoring_url = f"{self.endpoint_url}/score"
         else:
             self.scoring_url = self.endpoint_url
-    
-    def search(self, keywords: List[str], opportunity_types: List[str], 
-               max_results: int = 20) -> Dict[str, Any]:
-        headers = {
+        self._headers = {
             "Content-Type": "application/json",
             "Authorization": f"Bearer {self.api_key}",
             "azureml-model-deployment": "default"
         }
+        self._session = create_http_session()
+    
+    def search(self, keywords: List[str], opportunity_types: List[str], 
+               max_results: int = 20) -> Dict[str, Any]:
         payload = {
             "keywords": keywords,
             "opportunity_types": opportunity_types,
             "max_results": max_results
         }
-        response = requests.post(self.scoring_url, headers=headers, json=payload, timeout=180)
+        response = self._session.post(self.scoring_url, headers=self._headers, data=json_dumps(payload), timeout=180)
         response.raise_for_status()
-        result = response.json()
-        if isinstance(result, str):
-            result = json.loads(result)
-        return result
+        return parse_scoring_response(response.content)
 
 
 class ProposalArchitectClient:
@@ -130,19 +190,17 @@ class ProposalArchitectClient:
             self.scoring_url = f"{self.endpoint_url}/score"
         else:
             self.scoring_url = self.endpoint_url
-    
-    def _make_request(self, payload: Dict) -> Dict:
-        headers = {
+        self._headers = {
             "Content-Type": "application/json",
             "Authorization": f"Bearer {self.api_key}",
             "azureml-model-deployment": "default"
         }
-        response = requests.post(self.scoring_url, headers=headers, json=payload, timeout=180)
+        self._session = create_http_session()
+    
+    def _make_request(self, payload: Dict) -> Dict:
+        response = self._session.post(self.scoring_url, headers=self._headers, data=json_dumps(payload), timeout=180)
         response.raise_for_status()
-        result = response.json()
-        if isinstance(result, str):
-            result = json.loads(result)
-        return result
+        return parse_scoring_response(response.content)
     
     def upload(self, opportunities_json: str, profile_text: str = None,
                resume_base64: str = None, resume_filename: str = None,
@@ -172,112 +230,229 @@ class ProposalArchitectClient:
         }
         return self._make_request(payload)
     
-    def generate_all_proposals(self, session_id: str, max_proposals: int = 5) -> Dict:
-        payload = {
-            "action": "generate_all_proposals",
-            "session_id": session_id,
-            "max_proposals": max_proposals
-        }
-        return self._make_request(payload)
+    def generate_proposals(self, session_id: str, opportunity_ids: List[str],
+                           max_workers: int = 4) -> Iterator[Tuple[str, Dict]]:
+        """Generate proposals concurrently, yielding (opportunity_id, result) as each completes."""
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.generate_proposal, session_id, opp_id): opp_id
+                for opp_id in opportunity_ids
+            }
+            for future in as_completed(futures):
+                opp_id = futures[future]
+                try:
+                    yield opp_id, future.result()
+                except Exception as e:
+                    yield opp_id, {"success": False, "error": str(e)}
 
 
 # =============================================================================
 # PASSWORD PROTECTION
 # =============================================================================
 
+LOGIN_HEADER_HTML = """
+<div style="text-align: center; padding: 50px;">
+    <h1>🎯 Opportunity Scout & Proposal Architect</h1>
+    <p style="color: #666;">AI-Powered Speaking Opportunity Finder & Proposal Generator</p>
+    <br>
+</div>
+"""
+
+
 def check_password():
     """Returns True if the user has entered the correct password."""
     
     def password_entered():
-        if st.session_state["password"] == st.secrets.get("APP_PASSWORD", ""):
+        entered = st.session_state["password"].encode("utf-8")
+        expected = st.secrets.get("APP_PASSWORD", "").encode("utf-8")
+        if hmac.compare_digest(entered, expected):
             st.session_state["password_correct"] = True
             del st.session_state["password"]
         else:
             st.session_state["password_correct"] = False
 
-    if "password_correct" not in st.session_state:
-        st.markdown("""
-        <div style="text-align: center; padding: 50px;">
-            <h1>🎯 Opportunity Scout & Proposal Architect</h1>
-            <p style="color: #666;">AI-Powered Speaking Opportunity Finder & Proposal Generator</p>
-            <br>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        col1, col2, col3 = st.columns([1, 2, 1])
-        with col2:
-            st.text_input(
-                "🔐 Enter Access Code", 
-                type="password", 
-                on_change=password_entered, 
-                key="password",
-                placeholder="Enter your access code..."
-            )
+    password_correct = st.session_state.get("password_correct")
+    if password_correct:
+        return True
+    
+    st.markdown(LOGIN_HEADER_HTML, unsafe_allow_html=True)
+    
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        st.text_input(
+            "🔐 Enter Access Code", 
+            type="password", 
+            on_change=password_entered, 
+            key="password",
+            placeholder="Enter your access code..."
+        )
+        if password_correct is False:
+            st.error("❌ Incorrect access code. Please try again.")
+        else:
             st.markdown("""
             <p style="text-align: center; color: #888; font-size: 0.9rem;">
                 Don't have an access code? Contact the administrator.
             </p>
             """, unsafe_allow_html=True)
-        return False
-    
-    elif not st.session_state["password_correct"]:
-        st.markdown("""
-        <div style="text-align: center; padding: 50px;">
-            <h1>🎯 Opportunity Scout & Proposal Architect</h1>
-            <p style="color: #666;">AI-Powered Speaking Opportunity Finder & Proposal Generator</p>
-            <br>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        col1, col2, col3 = st.columns([1, 2, 1])
-        with col2:
-            st.text_input(
-                "🔐 Enter Access Code", 
-                type="password", 
-                on_change=password_entered, 
-                key="password",
-                placeholder="Enter your access code..."
-            )
-            st.error("❌ Incorrect access code. Please try again.")
-        return False
-    
-    else:
-        return True
+    return False
 
 
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
 
+@st.cache_resource
+def create_opportunity_scout_client(endpoint: str, api_key: str) -> OpportunityScoutClient:
+    """Create the Opportunity Scout client once per credentials, shared across reruns and sessions."""
+    return OpportunityScoutClient(endpoint, api_key)
+
+
+@st.cache_resource
+def create_proposal_architect_client(endpoint: str, api_key: str) -> ProposalArchitectClient:
+    """Create the Proposal Architect client once per credentials, shared across reruns and sessions."""
+    return ProposalArchitectClient(endpoint, api_key)
+
+
 def get_opportunity_scout_client() -> Optional[OpportunityScoutClient]:
-    """Get Opportunity Scout client."""
+    """Get Opportunity Scout client, or None while credentials are not configured."""
     endpoint = st.secrets.get("AZURE_ML_ENDPOINT_A", "")
     api_key = st.secrets.get("AZURE_ML_KEY_A", "")
     if endpoint and api_key:
-        return OpportunityScoutClient(endpoint, api_key)
+        return create_opportunity_scout_client(endpoint, api_key)
     return None
 
 
 def get_proposal_architect_client() -> Optional[ProposalArchitectClient]:
-    """Get Proposal Architect client."""
+    """Get Proposal Architect client, or None while credentials are not configured."""
     endpoint = st.secrets.get("AZURE_ML_ENDPOINT_B", "")
     api_key = st.secrets.get("AZURE_ML_KEY_B", "")
     if endpoint and api_key:
-        return ProposalArchitectClient(endpoint, api_key)
+        return create_proposal_architect_client(endpoint, api_key)
     return None
 
 
+DISPLAY_DATE_FORMAT = "%B %d, %Y"
+
+
+@functools.lru_cache(maxsize=1024)
 def format_date(date_str: str) -> str:
     """Format date string for display."""
     if not date_str:
         return "TBD"
     try:
-        date_obj = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-        return date_obj.strftime("%B %d, %Y")
+        date_obj = parse_iso_datetime(date_str)
+        return date_obj.strftime(DISPLAY_DATE_FORMAT)
     except:
         return date_str
 
 
+def format_location(city: Optional[str], country: Optional[str], is_virtual: bool) -> str:
+    """Format an opportunity location, or an empty string if unknown."""
+    loc_parts = [part for part in (city, country) if part]
+    if loc_parts:
+        return ", ".join(loc_parts)
+    return "Virtual" if is_virtual else ""
+
+
+@functools.lru_cache(maxsize=256)
+def format_compensation(is_paid: bool, amount: Optional[float]) -> str:
+    """Format opportunity compensation for display."""
+    if not is_paid:
+        return "Unpaid/Unknown"
+    return f"${amount:,.0f}" if amount else "Paid"
+
+
+def build_opportunity_table(opportunities: List[Dict], start: int = 1) -> pd.DataFrame:
+    """Flatten raw opportunities into one table for st.dataframe, numbered from start."""
+    rows = []
+    for i, opp in enumerate(opportunities, start):
+        dates = opp.get("dates", {})
+        location = opp.get("location", {})
+        comp = opp.get("compensation", {})
+        rows.append({
+            "#": i,
+            "Event": opp.get("event_name", "Unknown Event"),
+            "Type": opp.get("event_type", "N/A"),
+            "Date": format_date(dates.get("start_date")),
+            "Deadline": format_date(dates.get("application_deadline")),
+            "Location": format_location(location.get("city"), location.get("country"), location.get("is_virtual", False)),
+            "Compensation": format_compensation(comp.get("is_paid", False), comp.get("amount")),
+            "Apply": opp.get("application", {}).get("url")
+        })
+    return pd.DataFrame(rows)
+
+
+RESPONSE_CACHE_SIZE = 16
+PROPOSAL_CACHE_SIZE = 64
+
+
+def _response_cache_key(key_parts: Any) -> str:
+    return hashlib.blake2b(json.dumps(key_parts, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def get_cached_response(cache_name: str, key_parts: Any) -> Optional[Dict]:
+    """Look up a backend response in a per-session LRU cache."""
+    cache = st.session_state.setdefault(cache_name, OrderedDict())
+    key = _response_cache_key(key_parts)
+    if key in cache:
+        cache.move_to_end(key)
+        return cache[key]
+    return None
+
+
+def store_cached_response(cache_name: str, key_parts: Any, result: Dict,
+                          max_entries: int = RESPONSE_CACHE_SIZE):
+    """Store a backend response in a per-session LRU cache, evicting the oldest entry."""
+    # Don't cache failed Proposal Architect responses
+    if not result.get("success", True):
+        return
+    cache = st.session_state.setdefault(cache_name, OrderedDict())
+    key = _response_cache_key(key_parts)
+    cache[key] = result
+    cache.move_to_end(key)
+    if len(cache) > max_entries:
+        cache.popitem(last=False)
+
+
+def cached_response(cache_name: str, key_parts: Any, fetch: Callable[[], Dict],
+                    force_refresh: bool = False, max_entries: int = RESPONSE_CACHE_SIZE) -> Dict:
+    """Return a backend response from a per-session LRU cache, calling fetch() on a miss."""
+    if not force_refresh:
+        cached = get_cached_response(cache_name, key_parts)
+        if cached is not None:
+            return cached
+    
+    result = fetch()
+    store_cached_response(cache_name, key_parts, result, max_entries)
+    return result
+
+
+def hash_upload_inputs(*parts: Union[bytes, memoryview, str, None]) -> str:
+    """Fingerprint the upload inputs so an unchanged re-upload can be skipped."""
+    digest = hashlib.blake2b()
+    for part in parts:
+        if part is None:
+            part = b""
+        elif isinstance(part, str):
+            part = part.encode("utf-8")
+        # Length-prefix each part so adjacent fields can't run together
+        digest.update(len(part).to_bytes(8, "little"))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+def build_proposals_download(proposals: List[Dict]) -> str:
+    """Join generated proposals into a single plain-text download."""
+    sections = [
+        f"{prop.get('event_name', 'Unknown')}\n"
+        f"Subject: {prop.get('subject_line', 'N/A')}\n\n"
+        f"{prop.get('full_proposal', '')}"
+        for prop in proposals
+    ]
+    return ("\n\n" + "=" * 60 + "\n\n").join(sections)
+
+
+@functools.lru_cache(maxsize=128)
 def get_match_score_class(score: float) -> str:
     """Get CSS class based on match score."""
     if score >= 0.8:
@@ -292,6 +467,11 @@ def get_match_score_class(score: float) -> str:
 # TAB 1: OPPORTUNITY SCOUT
 # =============================================================================
 
+DETAILED_RESULTS = 3
+# Above this many results, everything past the top matches goes in one table
+TABLE_RESULTS_THRESHOLD = 20
+
+
 def render_opportunity_scout_tab():
     """Render the Opportunity Scout tab."""
     
@@ -313,6 +493,12 @@ def render_opportunity_scout_tab():
         selected_types = [k for k, v in opp_types.items() if v]
         
         max_results = st.slider("📊 Max Results", 5, 50, 20, key="scout_max")
+        force_refresh = st.checkbox(
+            "🔄 Force refresh",
+            value=False,
+            key="scout_force_refresh",
+            help="Ignore cached results and search again"
+        )
     
     # Main content
     keywords_input = st.text_area(
@@ -322,13 +508,7 @@ def render_opportunity_scout_tab():
         key="scout_keywords"
     )
     
-    keywords = []
-    if keywords_input:
-        for line in keywords_input.split('\n'):
-            for kw in line.split(','):
-                kw = kw.strip()
-                if kw:
-                    keywords.append(kw)
+    keywords = parse_keywords(keywords_input)
     
     if keywords:
         st.markdown("**Keywords:** " + ", ".join([f"`{kw}`" for kw in keywords]))
@@ -339,13 +519,13 @@ def render_opportunity_scout_tab():
             "🔍 Search for Opportunities",
             type="primary",
             use_container_width=True,
-            disabled=len(keywords) == 0 or len(selected_types) == 0,
+            disabled=not keywords or not selected_types,
             key="scout_search_btn"
         )
     
-    if len(keywords) == 0:
+    if not keywords:
         st.warning("⚠️ Please enter at least one keyword.")
-    if len(selected_types) == 0:
+    if not selected_types:
         st.warning("⚠️ Please select at least one opportunity type.")
     
     # Process search
@@ -357,8 +537,14 @@ def render_opportunity_scout_tab():
         
         with st.spinner("🔍 Searching... This may take 1-2 minutes."):
             try:
-                response = client.search(keywords, selected_types, max_results)
+                response = cached_response(
+                    "_scout_cache",
+                    [sorted(keywords), sorted(selected_types), max_results],
+                    lambda: client.search(keywords, selected_types, max_results),
+                    force_refresh=force_refresh
+                )
                 st.session_state["scout_response"] = response
+                st.session_state["scout_response_id"] = uuid.uuid4().hex
                 st.success(f"✅ Found {len(response.get('opportunities', []))} opportunities!")
             except Exception as e:
                 st.error(f"❌ Search failed: {str(e)}")
@@ -374,7 +560,7 @@ def render_opportunity_scout_tab():
             st.subheader(f"📋 Results ({len(opportunities)} opportunities)")
             
             # Download button
-            json_data = json.dumps(response, indent=2)
+            json_data = serialize_download(st.session_state["scout_response_id"], response)
             st.download_button(
                 label="📥 Download Results as JSON",
                 data=json_data,
@@ -387,41 +573,35 @@ def render_opportunity_scout_tab():
             
             st.divider()
             
-            # Display each opportunity
-            for i, opp in enumerate(opportunities, 1):
-                with st.expander(f"{i}. {opp.get('event_name', 'Unknown Event')}", expanded=(i <= 3)):
+            # Large result sets: top matches in detail, the rest as a single table
+            if len(opportunities) > TABLE_RESULTS_THRESHOLD:
+                detailed = opportunities[:DETAILED_RESULTS]
+            else:
+                detailed = opportunities
+            for i, opp in enumerate(detailed, 1):
+                with st.expander(f"{i}. {opp.get('event_name', 'Unknown Event')}", expanded=(i <= DETAILED_RESULTS)):
                     col1, col2 = st.columns(2)
                     
                     with col1:
-                        st.markdown(f"**Type:** {opp.get('event_type', 'N/A')}")
-                        
+                        lines = [f"**Type:** {opp.get('event_type', 'N/A')}"]
                         dates = opp.get("dates", {})
                         if dates.get("start_date"):
-                            st.markdown(f"**Date:** {format_date(dates['start_date'])}")
+                            lines.append(f"**Date:** {format_date(dates['start_date'])}")
                         if dates.get("application_deadline"):
-                            st.markdown(f"**Deadline:** {format_date(dates['application_deadline'])}")
+                            lines.append(f"**Deadline:** {format_date(dates['application_deadline'])}")
+                        st.markdown("\n\n".join(lines))
                     
                     with col2:
+                        lines = []
                         location = opp.get("location", {})
-                        loc_parts = []
-                        if location.get("city"):
-                            loc_parts.append(location["city"])
-                        if location.get("country"):
-                            loc_parts.append(location["country"])
-                        if loc_parts:
-                            st.markdown(f"**Location:** {', '.join(loc_parts)}")
-                        elif location.get("is_virtual"):
-                            st.markdown("**Location:** Virtual")
-                        
+                        location_text = format_location(
+                            location.get("city"), location.get("country"), location.get("is_virtual", False)
+                        )
+                        if location_text:
+                            lines.append(f"**Location:** {location_text}")
                         comp = opp.get("compensation", {})
-                        if comp.get("is_paid"):
-                            amount = comp.get("amount")
-                            if amount:
-                                st.markdown(f"**Compensation:** ${amount:,.0f}")
-                            else:
-                                st.markdown("**Compensation:** Paid")
-                        else:
-                            st.markdown("**Compensation:** Unpaid/Unknown")
+                        lines.append(f"**Compensation:** {format_compensation(comp.get('is_paid', False), comp.get('amount'))}")
+                        st.markdown("\n\n".join(lines))
                     
                     if opp.get("description"):
                         st.markdown(f"**Description:** {opp['description'][:300]}...")
@@ -429,12 +609,124 @@ def render_opportunity_scout_tab():
                     app_info = opp.get("application", {})
                     if app_info.get("url"):
                         st.link_button("🔗 Apply Now", app_info["url"])
+            
+            if len(detailed) < len(opportunities):
+                st.markdown("**More opportunities**")
+                st.dataframe(
+                    build_opportunity_table(opportunities[len(detailed):], start=len(detailed) + 1),
+                    column_config={"Apply": st.column_config.LinkColumn("Apply")},
+                    hide_index=True,
+                    use_container_width=True
+                )
 
 
 # =============================================================================
 # TAB 2: PROPOSAL ARCHITECT
 # =============================================================================
 
+RANKED_PAGE_SIZE = 10
+
+
+@st.fragment
+def render_ranked_opportunity(opp: Dict, index: int):
+    """Render one ranked opportunity card; its buttons only rerun this card."""
+    score = opp.get("match_score", 0)
+    score_class = get_match_score_class(score)
+    
+    with st.expander(f"#{index} - {opp.get('event_name', 'Unknown')} ({score:.0%} match)", expanded=(index <= 3)):
+        col1, col2, col3 = st.columns([1, 1, 1])
+        
+        with col1:
+            st.markdown(
+                f"**Match Score:** <span class='{score_class}'>{score:.0%}</span>\n\n"
+                f"**Type:** {opp.get('event_type', 'N/A')}\n\n"
+                f"**Paid:** {'Yes 💰' if opp.get('is_paid') else 'No'}",
+                unsafe_allow_html=True
+            )
+        
+        with col2:
+            lines = []
+            if opp.get("start_date"):
+                lines.append(f"**Date:** {format_date(opp['start_date'])}")
+            if opp.get("location"):
+                lines.append(f"**Location:** {opp['location']}")
+            elif opp.get("is_virtual"):
+                lines.append("**Location:** Virtual 🌐")
+            if lines:
+                st.markdown("\n\n".join(lines))
+        
+        with col3:
+            lines = []
+            if opp.get("application_deadline"):
+                lines.append(f"**Deadline:** {format_date(opp['application_deadline'])}")
+            if opp.get("days_until_deadline"):
+                lines.append(f"**Days Left:** {opp['days_until_deadline']}")
+            if lines:
+                st.markdown("\n\n".join(lines))
+        
+        # Match reasons and keywords
+        lines = []
+        reasons = opp.get("match_reasons", [])
+        if reasons:
+            lines.append("**Why it's a good match:**\n" + "\n".join(f"- {reason}" for reason in reasons[:3]))
+        keywords = opp.get("matching_keywords", [])
+        if keywords:
+            lines.append(f"**Matching Keywords:** {', '.join(keywords[:5])}")
+        if lines:
+            st.markdown("\n\n".join(lines))
+        
+        # Generate proposal button; an explicit regenerate bypasses the proposal cache
+        opp_id = opp.get("opportunity_id")
+        prop_key = f"proposal_{opp_id}"
+        has_proposal = prop_key in st.session_state
+        button_label = "🔄 Regenerate Proposal" if has_proposal else "📝 Generate Proposal"
+        if st.button(button_label, key=f"gen_prop_{opp.get('opportunity_id', index)}"):
+            client = get_proposal_architect_client()
+            session_id = st.session_state["arch_session_id"]
+            with st.spinner("📝 Generating personalized proposal..."):
+                try:
+                    prop_result = cached_response(
+                        "_proposal_cache",
+                        [session_id, opp_id],
+                        lambda: client.generate_proposal(session_id, opp_id),
+                        force_refresh=has_proposal,
+                        max_entries=PROPOSAL_CACHE_SIZE
+                    )
+                    
+                    if prop_result.get("success"):
+                        proposal = prop_result.get("proposal", {})
+                        st.session_state[prop_key] = proposal
+                        # Reset the text area so it shows the new draft
+                        st.session_state.pop(f"prop_text_{opp_id}", None)
+                    else:
+                        st.error(f"❌ Failed: {prop_result.get('error')}")
+                except Exception as e:
+                    st.error(f"❌ Failed: {str(e)}")
+            if prop_key in st.session_state and not has_proposal:
+                # Redraw so the button switches to "Regenerate"
+                st.rerun()
+        
+        # Display generated proposal
+        if prop_key in st.session_state:
+            proposal = st.session_state[prop_key]
+            st.divider()
+            st.markdown(f"### 📧 Generated Proposal\n\n**Subject:** {proposal.get('subject_line', 'N/A')}")
+            st.text_area(
+                "Full Proposal",
+                value=proposal.get("full_proposal", ""),
+                height=300,
+                key=f"prop_text_{opp.get('opportunity_id')}"
+            )
+            
+            st.download_button(
+                "📥 Download Proposal",
+                data=proposal.get("full_proposal", ""),
+                file_name=f"proposal_{opp.get('event_name', 'unknown')[:20]}.txt",
+                mime="text/plain",
+                key=f"download_prop_{opp.get('opportunity_id')}"
+            )
+
+
 def render_proposal_architect_tab():
     """Render the Proposal Architect tab."""
     
@@ -456,9 +748,8 @@ def render_proposal_architect_tab():
         
         if uploaded_json:
             try:
-                json_content = uploaded_json.read().decode('utf-8')
-                json_data = json.loads(json_content)
-                opp_count = len(json_data.get("opportunities", []))
+                json_content = uploaded_json.getvalue()
+                opp_count = count_opportunities(uploaded_json.file_id, json_content)
                 st.success(f"✅ Loaded {opp_count} opportunities")
                 st.session_state["arch_opportunities_json"] = json_content
             except Exception as e:
@@ -474,9 +765,8 @@ def render_proposal_architect_tab():
         
         if uploaded_resume:
             st.success(f"✅ Uploaded: {uploaded_resume.name}")
-            resume_bytes = uploaded_resume.read()
-            st.session_state["arch_resume_base64"] = base64.b64encode(resume_bytes).decode('utf-8')
-            st.session_state["arch_resume_filename"] = uploaded_resume.name
+            # Keep the UploadedFile itself; it is only encoded when uploading
+            st.session_state["arch_resume_file"] = uploaded_resume
     
     st.markdown("**✍️ Your Profile/Bio**")
     profile_text = st.text_area(
@@ -508,7 +798,7 @@ Expertise: AI Ethics, Machine Learning, Data Science, Women in Tech""",
     )
     
     # Upload button
-    can_upload = "arch_opportunities_json" in st.session_state and (profile_text or "arch_resume_base64" in st.session_state)
+    can_upload = "arch_opportunities_json" in st.session_state and (profile_text or "arch_resume_file" in st.session_state)
     
     col1, col2, col3 = st.columns([1, 2, 1])
     with col2:
@@ -530,26 +820,40 @@ Expertise: AI Ethics, Machine Learning, Data Science, Women in Tech""",
             st.error("❌ Proposal Architect API not configured.")
             return
         
-        with st.spinner("📤 Uploading and processing your data..."):
-            try:
-                result = client.upload(
-                    opportunities_json=st.session_state.get("arch_opportunities_json", "{}"),
-                    profile_text=profile_text,
-                    resume_base64=st.session_state.get("arch_resume_base64"),
-                    resume_filename=st.session_state.get("arch_resume_filename"),
-                    preferences_text=preferences_text
-                )
-                
-                if result.get("success"):
-                    st.session_state["arch_session_id"] = result["session_id"]
-                    st.session_state["arch_profile_summary"] = result.get("profile_summary", "")
-                    st.success(f"✅ Upload successful! Session ID: {result['session_id'][:8]}...")
-                else:
-                    st.error(f"❌ Upload failed: {result.get('error')}")
+        resume_file = st.session_state.get("arch_resume_file")
+        opportunities_json = st.session_state.get("arch_opportunities_json", b"{}")
+        upload_hash = hash_upload_inputs(
+            opportunities_json,
+            profile_text,
+            preferences_text,
+            resume_file.name if resume_file else None,
+            resume_file.getbuffer() if resume_file else None
+        )
+        
+        if upload_hash == st.session_state.get("arch_upload_hash") and "arch_session_id" in st.session_state:
+            st.info("ℹ️ Nothing changed since the last upload, reusing the current session.")
+        else:
+            with st.spinner("📤 Uploading and processing your data..."):
+                try:
+                    result = client.upload(
+                        opportunities_json=opportunities_json.decode("utf-8"),
+                        profile_text=profile_text,
+                        resume_base64=b64encode_text(resume_file.getbuffer()) if resume_file else None,
+                        resume_filename=resume_file.name if resume_file else None,
+                        preferences_text=preferences_text
+                    )
+                    
+                    if result.get("success"):
+                        st.session_state["arch_session_id"] = result["session_id"]
+                        st.session_state["arch_upload_hash"] = upload_hash
+                        st.session_state["arch_profile_summary"] = result.get("profile_summary", "")
+                        st.success(f"✅ Upload successful! Session ID: {result['session_id'][:8]}...")
+                    else:
+                        st.error(f"❌ Upload failed: {result.get('error')}")
+                        return
+                except Exception as e:
+                    st.error(f"❌ Upload failed: {str(e)}")
                     return
-            except Exception as e:
-                st.error(f"❌ Upload failed: {str(e)}")
-                return
     
     # Step 2: Rank Opportunities
     if "arch_session_id" in st.session_state:
@@ -573,7 +877,8 @@ Expertise: AI Ethics, Machine Learning, Data Science, Women in Tech""",
             client = get_proposal_architect_client()
             with st.spinner("📊 Ranking opportunities based on your profile..."):
                 try:
-                    result = client.rank(st.session_state["arch_session_id"])
+                    session_id = st.session_state["arch_session_id"]
+                    result = cached_response("_rank_cache", session_id, lambda: client.rank(session_id))
                     
                     if result.get("success"):
                         st.session_state["arch_rankings"] = result
@@ -598,84 +903,22 @@ Expertise: AI Ethics, Machine Learning, Data Science, Women in Tech""",
             - **Expired:** {rankings.get('expired_opportunities', 0)}
             """)
             
-            for i, opp in enumerate(ranked_opps, 1):
-                score = opp.get("match_score", 0)
-                score_class = get_match_score_class(score)
-                
-                with st.expander(f"#{i} - {opp.get('event_name', 'Unknown')} ({score:.0%} match)", expanded=(i <= 3)):
-                    col1, col2, col3 = st.columns([1, 1, 1])
-                    
-                    with col1:
-                        st.markdown(f"**Match Score:** <span class='{score_class}'>{score:.0%}</span>", unsafe_allow_html=True)
-                        st.markdown(f"**Type:** {opp.get('event_type', 'N/A')}")
-                        st.markdown(f"**Paid:** {'Yes 💰' if opp.get('is_paid') else 'No'}")
-                    
-                    with col2:
-                        if opp.get("start_date"):
-                            st.markdown(f"**Date:** {format_date(opp['start_date'])}")
-                        if opp.get("location"):
-                            st.markdown(f"**Location:** {opp['location']}")
-                        elif opp.get("is_virtual"):
-                            st.markdown("**Location:** Virtual 🌐")
-                    
-                    with col3:
-                        if opp.get("application_deadline"):
-                            st.markdown(f"**Deadline:** {format_date(opp['application_deadline'])}")
-                        if opp.get("days_until_deadline"):
-                            st.markdown(f"**Days Left:** {opp['days_until_deadline']}")
-                    
-                    # Match reasons
-                    reasons = opp.get("match_reasons", [])
-                    if reasons:
-                        st.markdown("**Why it's a good match:**")
-                        for reason in reasons[:3]:
-                            st.markdown(f"- {reason}")
-                    
-                    # Keywords
-                    keywords = opp.get("matching_keywords", [])
-                    if keywords:
-                        st.markdown(f"**Matching Keywords:** {', '.join(keywords[:5])}")
-                    
-                    # Generate proposal button
-                    if st.button(f"📝 Generate Proposal", key=f"gen_prop_{opp.get('opportunity_id', i)}"):
-                        client = get_proposal_architect_client()
-                        with st.spinner("📝 Generating personalized proposal..."):
-                            try:
-                                prop_result = client.generate_proposal(
-                                    st.session_state["arch_session_id"],
-                                    opp.get("opportunity_id")
-                                )
-                                
-                                if prop_result.get("success"):
-                                    proposal = prop_result.get("proposal", {})
-                                    st.session_state[f"proposal_{opp.get('opportunity_id')}"] = proposal
-                                    st.success("✅ Proposal generated!")
-                                else:
-                                    st.error(f"❌ Failed: {prop_result.get('error')}")
-                            except Exception as e:
-                                st.error(f"❌ Failed: {str(e)}")
-                    
-                    # Display generated proposal
-                    prop_key = f"proposal_{opp.get('opportunity_id')}"
-                    if prop_key in st.session_state:
-                        proposal = st.session_state[prop_key]
-                        st.divider()
-                        st.markdown("### 📧 Generated Proposal")
-                        st.markdown(f"**Subject:** {proposal.get('subject_line', 'N/A')}")
-                        st.text_area(
-                            "Full Proposal",
-                            value=proposal.get("full_proposal", ""),
-                            height=300,
-                            key=f"prop_text_{opp.get('opportunity_id')}"
-                        )
-                        
-                        st.download_button(
-                            "📥 Download Proposal",
-                            data=proposal.get("full_proposal", ""),
-                            file_name=f"proposal_{opp.get('event_name', 'unknown')[:20]}.txt",
-                            mime="text/plain",
-                            key=f"download_prop_{opp.get('opportunity_id')}"
-                        )
+            # Only build widgets for the visible page of matches
+            page_count = (len(ranked_opps) + RANKED_PAGE_SIZE - 1) // RANKED_PAGE_SIZE
+            page = 1
+            if page_count > 1:
+                page = st.number_input(
+                    f"Page (of {page_count})",
+                    min_value=1,
+                    max_value=page_count,
+                    value=1,
+                    key="arch_rank_page"
+                )
+            start = (page - 1) * RANKED_PAGE_SIZE
+            visible_opps = ranked_opps[start:start + RANKED_PAGE_SIZE]
+            
+            for i, opp in enumerate(visible_opps, start + 1):
+                render_ranked_opportunity(opp, i)
             
             # Generate all proposals
             st.divider()
@@ -687,20 +930,54 @@ Expertise: AI Ethics, Machine Learning, Data Science, Women in Tech""",
             with col2:
                 if st.button("📝 Generate All Proposals", type="primary", use_container_width=True, key="gen_all_btn"):
                     client = get_proposal_architect_client()
-                    with st.spinner(f"📝 Generating {num_proposals} proposals... This may take a few minutes."):
-                        try:
-                            result = client.generate_all_proposals(
-                                st.session_state["arch_session_id"],
-                                num_proposals
-                            )
+                    top_opps = ranked_opps[:num_proposals]
+                    opp_ids = [opp.get("opportunity_id") for opp in top_opps]
+                    event_names = {opp.get("opportunity_id"): opp.get("event_name", "Unknown") for opp in top_opps}
+                    
+                    session_id = st.session_state["arch_session_id"]
+                    
+                    # Proposals already generated for this session are served from the cache
+                    cached_results = []
+                    pending_ids = []
+                    for opp_id in opp_ids:
+                        cached = get_cached_response("_proposal_cache", [session_id, opp_id])
+                        if cached is not None:
+                            cached_results.append((opp_id, cached))
+                        else:
+                            pending_ids.append(opp_id)
+                    
+                    progress = st.progress(0.0, text=f"📝 Generating {len(opp_ids)} proposals...")
+                    generated = {}
+                    errors = []
+                    proposals = []
+                    # Slider caps this at 10, within the client's connection pool size
+                    fresh_results = client.generate_proposals(
+                        session_id, pending_ids, max_workers=max(1, len(pending_ids))
+                    )
+                    for done, (opp_id, prop_result) in enumerate(itertools.chain(cached_results, fresh_results), 1):
+                        store_cached_response("_proposal_cache", [session_id, opp_id], prop_result, PROPOSAL_CACHE_SIZE)
+                        if prop_result.get("success"):
+                            proposal = prop_result.get("proposal", {})
+                            st.session_state[f"proposal_{opp_id}"] = proposal
+                            generated[opp_id] = {**proposal, "id": opp_id, "event_name": event_names[opp_id]}
                             
-                            if result.get("success"):
-                                st.session_state["arch_all_proposals"] = result
-                                st.success(f"✅ Generated {result.get('total_generated', 0)} proposals!")
-                            else:
-                                st.error(f"❌ Failed: {result.get('error')}")
-                        except Exception as e:
-                            st.error(f"❌ Failed: {str(e)}")
+                            # Publish after every result so an interrupted run keeps what already finished,
+                            # in ranking order regardless of completion order
+                            proposals = [generated[oid] for oid in opp_ids if oid in generated]
+                            st.session_state["arch_all_proposals"] = {
+                                "success": True,
+                                "proposals": proposals,
+                                "total_generated": len(proposals),
+                                "download_text": build_proposals_download(proposals)
+                            }
+                        else:
+                            errors.append(f"{event_names[opp_id]}: {prop_result.get('error')}")
+                        progress.progress(done / len(opp_ids), text=f"📝 Generated {done}/{len(opp_ids)} proposals...")
+                    
+                    if proposals:
+                        st.success(f"✅ Generated {len(proposals)} proposals!")
+                    for error in errors:
+                        st.error(f"❌ Failed: {error}")
             
             # Display all proposals
             if "arch_all_proposals" in st.session_state:
@@ -8,12 +8,21 @@ Password protected for authorized access only.
 """
 
 import streamlit as st
+import functools
+import html
 import json
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import os
+import uuid
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from utils.api_client import OpportunityScoutClient, SearchRequest, Opportunity
+from utils.parsing import parse_keywords, parse_iso_datetime
 
 # =============================================================================
 # PAGE CONFIGURATION
@@ -120,6 +129,22 @@ st.markdown("""
         margin-bottom: 1rem;
         border-left: 4px solid #1E88E5;
     }
+    .card-header {
+        display: flex;
+        justify-content: space-between;
+        align-items: baseline;
+    }
+    .card-columns {
+        display: flex;
+        gap: 1rem;
+        margin: 0.75rem 0;
+    }
+    .card-columns > div {
+        flex: 1;
+    }
+    .card-links a {
+        margin-right: 1.5rem;
+    }
     .paid-badge {
         background-color: #4CAF50;
         color: white;
@@ -156,32 +181,98 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Static page chrome, emitted once per rerun as a single element each
+APP_HEADER_HTML = (
+    '<p class="main-header">🔍 Opportunity Scout</p>'
+    '<p class="sub-header">AI-Powered Speaking Opportunity Finder</p>'
+)
+
+APP_FOOTER_HTML = """
+<div style="text-align: center; color: #888; font-size: 0.9rem;">
+    <p>Opportunity Scout - AI-Powered Speaking Opportunity Finder</p>
+    <p>💡 Tip: Download results as JSON to use with Proposal Architect</p>
+</div>
+"""
+
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
 
-def get_api_client() -> OpportunityScoutClient:
-    """Get or create API client from session state."""
+@st.cache_resource
+def create_api_client(endpoint_url: str, api_key: str) -> OpportunityScoutClient:
+    """Create the API client once per credentials, shared across reruns and sessions."""
+    return OpportunityScoutClient(endpoint_url, api_key)
+
+
+def get_api_client() -> Optional[OpportunityScoutClient]:
+    """Get the shared API client, or None while credentials are not configured."""
     endpoint_url = st.secrets.get("AZURE_ML_ENDPOINT_A", os.getenv("AZURE_ML_ENDPOINT_A", ""))
     api_key = st.secrets.get("AZURE_ML_KEY_A", os.getenv("AZURE_ML_KEY_A", ""))
     
     if not endpoint_url or not api_key:
         return None
     
-    return OpportunityScoutClient(endpoint_url, api_key)
+    return create_api_client(endpoint_url, api_key)
 
 
+@st.cache_data(ttl=3600, max_entries=128, show_spinner=False)
+def cached_search(keywords_key: tuple, types_key: tuple, location_preference: str,
+                  time_frame_months: int, max_results: int,
+                  _keywords: List[str], _opportunity_types: List[str]) -> Dict[str, Any]:
+    """Run a search once per distinct set of parameters, reusing results for an hour."""
+    # The sorted *_key tuples only form the cache key; the backend gets the inputs as entered
+    request = SearchRequest(
+        keywords=_keywords,
+        opportunity_types=_opportunity_types,
+        location_preference=location_preference,
+        time_frame_months=time_frame_months,
+        max_results=max_results
+    )
+    return get_api_client().search(request)
+
+
+RESULT_SORT_KEYS = {
+    "confidence": (lambda o: o.confidence_score, True),
+    "date": (lambda o: o.start_date or "9999", False),
+    "name": (lambda o: o.name_lower, False)
+}
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def filter_opportunities(response_id: str, filter_paid: str, filter_virtual: str, sort_by: str,
+                         _opportunities_data: List[Dict[str, Any]]) -> List[Opportunity]:
+    """Parse, filter and sort a response's opportunities once per response and filter combination."""
+    # None means "all"; otherwise the flag value an opportunity must have
+    want_paid = {"paid": True, "unpaid": False}.get(filter_paid)
+    want_virtual = {"virtual": True, "in_person": False}.get(filter_virtual)
+    sort_key, reverse = RESULT_SORT_KEYS[sort_by]
+    
+    # One filtering pass and one sort, without intermediate lists
+    opportunities = (Opportunity.from_api_response(o) for o in _opportunities_data)
+    return sorted(
+        (
+            o for o in opportunities
+            if (want_paid is None or bool(o.is_paid) == want_paid)
+            and (want_virtual is None or bool(o.is_virtual) == want_virtual)
+        ),
+        key=sort_key,
+        reverse=reverse
+    )
+
+
+@functools.lru_cache(maxsize=4096)
 def format_date(date_str: str) -> str:
     """Format date string for display."""
     if not date_str:
         return "TBD"
     try:
-        date_obj = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+        date_obj = parse_iso_datetime(date_str)
         return date_obj.strftime("%B %d, %Y")
     except:
         return date_str
 
 
+@functools.lru_cache(maxsize=128)
 def get_confidence_class(score: float) -> str:
     """Get CSS class based on confidence score."""
     if score >= 0.8:
@@ -192,106 +283,164 @@ def get_confidence_class(score: float) -> str:
         return "confidence-low"
 
 
-def render_opportunity_card(opp: Opportunity, index: int):
-    """Render a single opportunity card."""
+# Badge text keyed by (is_paid, is_virtual)
+BADGE_LABELS = {
+    (True, True): "💰 Paid | 🌐 Virtual",
+    (True, False): "💰 Paid",
+    (False, True): "🎯 Unpaid | 🌐 Virtual",
+    (False, False): "🎯 Unpaid"
+}
+
+
+def build_opportunity_card_html(opp: Opportunity, index: int) -> str:
+    """Build the static HTML for a single opportunity card."""
+    def esc(text: Optional[str]) -> str:
+        # Also escape "$" so Streamlit's markdown never reads amounts as LaTeX, and turn
+        # line breaks into <br> since a blank line would end the markdown HTML block
+        escaped = html.escape(text or "").replace("$", "&#36;")
+        return "<br>".join(escaped.splitlines())
     
-    with st.container():
-        # Header with event name and badges
-        col1, col2 = st.columns([3, 1])
-        
-        with col1:
-            st.markdown(f"### {index}. {opp.event_name}")
-        
-        with col2:
-            badges = []
-            if opp.is_paid:
-                badges.append("💰 Paid")
-            else:
-                badges.append("🎯 Unpaid")
-            if opp.is_virtual:
-                badges.append("🌐 Virtual")
-            st.markdown(" | ".join(badges))
-        
-        # Details in columns
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.markdown("**📅 Dates**")
-            if opp.start_date:
-                st.write(f"Start: {format_date(opp.start_date)}")
-            if opp.end_date:
-                st.write(f"End: {format_date(opp.end_date)}")
-            if opp.application_deadline:
-                st.write(f"⏰ Deadline: {format_date(opp.application_deadline)}")
-        
-        with col2:
-            st.markdown("**📍 Location**")
-            location_parts = []
-            if opp.city:
-                location_parts.append(opp.city)
-            if opp.country:
-                location_parts.append(opp.country)
-            if location_parts:
-                st.write(", ".join(location_parts))
-            elif opp.is_virtual:
-                st.write("Virtual Event")
-            else:
-                st.write("Location TBD")
-        
-        with col3:
-            st.markdown("**💵 Compensation**")
-            if opp.is_paid and opp.compensation_amount:
-                st.write(f"${opp.compensation_amount:,.0f}")
-            elif opp.is_paid:
-                st.write("Paid (amount TBD)")
-            elif opp.compensation_details:
-                st.write(opp.compensation_details)
-            else:
-                st.write("Not specified")
-        
-        # Description
-        if opp.description:
-            with st.expander("📝 Description"):
-                st.write(opp.description)
-        
-        # Event type and confidence
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.markdown(f"**Type:** {opp.event_type.replace('_', ' ').title()}")
-        
-        with col2:
-            confidence_pct = int(opp.confidence_score * 100)
-            confidence_class = get_confidence_class(opp.confidence_score)
-            st.markdown(f"**Confidence:** <span class='{confidence_class}'>{confidence_pct}%</span>", 
-                       unsafe_allow_html=True)
-        
-        with col3:
-            if opp.keywords_matched:
-                st.markdown(f"**Keywords:** {', '.join(opp.keywords_matched[:3])}")
-        
-        # Action buttons
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            if opp.application_url:
-                st.link_button("🔗 Apply Now", opp.application_url, use_container_width=True)
-        
-        with col2:
-            if opp.source_url:
-                st.link_button("🌐 View Source", opp.source_url, use_container_width=True)
-        
-        st.divider()
+    def safe_url(url: Optional[str]) -> Optional[str]:
+        # Scraped links: only emit http(s) hrefs
+        if url and url.lower().startswith(("http://", "https://")):
+            return url
+        return None
+    
+    dates = []
+    if opp.start_date:
+        dates.append(f"Start: {esc(format_date(opp.start_date))}")
+    if opp.end_date:
+        dates.append(f"End: {esc(format_date(opp.end_date))}")
+    if opp.application_deadline:
+        dates.append(f"⏰ Deadline: {esc(format_date(opp.application_deadline))}")
+    
+    location_parts = [part for part in (opp.city, opp.country) if part]
+    if location_parts:
+        location = esc(", ".join(location_parts))
+    elif opp.is_virtual:
+        location = "Virtual Event"
+    else:
+        location = "Location TBD"
+    
+    if opp.is_paid and opp.compensation_amount:
+        compensation = f"&#36;{opp.compensation_amount:,.0f}"
+    elif opp.is_paid:
+        compensation = "Paid (amount TBD)"
+    elif opp.compensation_details:
+        compensation = esc(opp.compensation_details)
+    else:
+        compensation = "Not specified"
+    
+    confidence_class = get_confidence_class(opp.confidence_score)
+    details = [
+        f"<div><strong>Type:</strong> {esc((opp.event_type or 'other').replace('_', ' ').title())}</div>",
+        f"<div><strong>Confidence:</strong> <span class='{confidence_class}'>{int(opp.confidence_score * 100)}%</span></div>",
+        f"<div><strong>Keywords:</strong> {esc(', '.join(opp.keywords_matched[:3]))}</div>" if opp.keywords_matched else "<div></div>"
+    ]
+    
+    links = []
+    application_url = safe_url(opp.application_url)
+    if application_url:
+        links.append(f"<a href='{esc(application_url)}' target='_blank'>🔗 Apply Now</a>")
+    source_url = safe_url(opp.source_url)
+    if source_url:
+        links.append(f"<a href='{esc(source_url)}' target='_blank'>🌐 View Source</a>")
+    
+    # No blank lines or leading indentation, so markdown keeps this as one HTML block
+    parts = [
+        "<div class='opportunity-card'>",
+        f"<div class='card-header'><h3>{index}. {esc(opp.event_name or 'Unknown Event')}</h3>",
+        f"<span>{BADGE_LABELS[(bool(opp.is_paid), bool(opp.is_virtual))]}</span></div>",
+        "<div class='card-columns'>",
+        f"<div><strong>📅 Dates</strong><br>{'<br>'.join(dates)}</div>",
+        f"<div><strong>📍 Location</strong><br>{location}</div>",
+        f"<div><strong>💵 Compensation</strong><br>{compensation}</div>",
+        "</div>"
+    ]
+    if opp.description:
+        parts.append(f"<details><summary>📝 Description</summary>{esc(opp.description)}</details>")
+    parts.append(f"<div class='card-columns'>{''.join(details)}</div>")
+    if links:
+        parts.append(f"<div class='card-links'>{''.join(links)}</div>")
+    parts.append("</div>")
+    return "".join(parts)
 
 
-def convert_to_json(opportunities: List[Dict], metadata: Dict) -> str:
-    """Convert opportunities to downloadable JSON."""
+@st.cache_data(max_entries=4, ttl=600, show_spinner=False)
+def convert_to_json(response_id: str, _opportunities: List[Dict], _metadata: Dict) -> bytes:
+    """Convert opportunities to downloadable JSON, once per search response."""
     export_data = {
-        "search_metadata": metadata,
-        "opportunities": opportunities,
-        "exported_at": datetime.now().isoformat()
+        "search_metadata": _metadata,
+        "opportunities": _opportunities,
+        "exported_at": datetime.now()
     }
-    return json.dumps(export_data, indent=2)
+    if orjson is not None:
+        # orjson serializes datetime natively and returns bytes directly
+        return orjson.dumps(export_data, option=orjson.OPT_INDENT_2)
+    export_data["exported_at"] = export_data["exported_at"].isoformat()
+    return json.dumps(export_data, indent=2).encode("utf-8")
+
+
+@st.fragment
+def render_results():
+    """Render the stored search results; filter changes rerun only this fragment."""
+    response = st.session_state["search_response"]
+    response_id = st.session_state.setdefault("search_response_id", uuid.uuid4().hex)
+    opportunities_data = response.get("opportunities", [])
+    metadata = response.get("search_metadata", {})
+    
+    st.divider()
+    st.header(f"📋 Results ({len(opportunities_data)} opportunities)")
+    
+    # Download button
+    if opportunities_data:
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col2:
+            json_data = convert_to_json(response_id, opportunities_data, metadata)
+            st.download_button(
+                label="📥 Download Results as JSON",
+                data=json_data,
+                file_name=f"opportunities_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+                mime="application/json",
+                use_container_width=True
+            )
+    
+    st.divider()
+    
+    # Filter and sort options
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        filter_paid = st.selectbox(
+            "💰 Compensation",
+            options=["all", "paid", "unpaid"],
+            format_func=lambda x: {"all": "All", "paid": "Paid Only", "unpaid": "Unpaid Only"}[x]
+        )
+    
+    with col2:
+        filter_virtual = st.selectbox(
+            "📍 Format",
+            options=["all", "virtual", "in_person"],
+            format_func=lambda x: {"all": "All", "virtual": "Virtual Only", "in_person": "In-Person Only"}[x]
+        )
+    
+    with col3:
+        sort_by = st.selectbox(
+            "📊 Sort By",
+            options=["confidence", "date", "name"],
+            format_func=lambda x: {"confidence": "Confidence Score", "date": "Event Date", "name": "Event Name"}[x]
+        )
+    
+    # Parse, filter and sort once per response and filter combination
+    opportunities = filter_opportunities(response_id, filter_paid, filter_virtual, sort_by, opportunities_data)
+    
+    # Display opportunities
+    if opportunities:
+        # One HTML block for the whole list instead of ~20 widgets per card
+        cards_html = "".join(build_opportunity_card_html(opp, i) for i, opp in enumerate(opportunities, 1))
+        st.markdown(cards_html, unsafe_allow_html=True)
+    else:
+        st.info("No opportunities match the current filters.")
 
 
 # =============================================================================
@@ -304,8 +453,7 @@ def main():
         return
     
     # Header
-    st.markdown('<p class="main-header">🔍 Opportunity Scout</p>', unsafe_allow_html=True)
-    st.markdown('<p class="sub-header">AI-Powered Speaking Opportunity Finder</p>', unsafe_allow_html=True)
+    st.markdown(APP_HEADER_HTML, unsafe_allow_html=True)
     
     # Sidebar for configuration
     with st.sidebar:
@@ -365,6 +513,12 @@ def main():
             value=20,
             help="Maximum number of opportunities to find"
         )
+        
+        force_refresh = st.checkbox(
+            "🔄 Force refresh",
+            value=False,
+            help="Ignore cached results and search again"
+        )
     
     # Main content area
     st.header("🔎 Search for Opportunities")
@@ -377,17 +531,8 @@ def main():
         help="Enter topics you want to speak about. Each keyword will be searched."
     )
     
-    # Parse keywords
-    if keywords_input:
-        # Handle both comma-separated and newline-separated
-        keywords = []
-        for line in keywords_input.split('\n'):
-            for kw in line.split(','):
-                kw = kw.strip()
-                if kw:
-                    keywords.append(kw)
-    else:
-        keywords = []
+    # Parse keywords (comma-separated and/or newline-separated)
+    keywords = parse_keywords(keywords_input)
     
     # Display parsed keywords
     if keywords:
@@ -401,13 +546,13 @@ def main():
             "🔍 Search for Opportunities",
             type="primary",
             use_container_width=True,
-            disabled=len(keywords) == 0 or len(selected_types) == 0
+            disabled=not keywords or not selected_types
         )
     
     # Validation messages
-    if len(keywords) == 0:
+    if not keywords:
         st.warning("⚠️ Please enter at least one keyword to search.")
-    if len(selected_types) == 0:
+    if not selected_types:
         st.warning("⚠️ Please select at least one opportunity type.")
     
     # Process search
@@ -419,23 +564,27 @@ def main():
             st.error("❌ API credentials not configured. Please contact administrator.")
             return
         
-        # Create search request
-        request = SearchRequest(
-            keywords=keywords,
-            opportunity_types=selected_types,
-            location_preference=location_pref,
-            time_frame_months=time_frame,
-            max_results=max_results
-        )
-        
         # Show progress
         with st.spinner("🔍 Searching for opportunities... This may take 1-2 minutes."):
             try:
-                # Make API call
-                response = client.search(request)
+                # Make API call; sorted tuples let reordered inputs share a cache entry
+                search_args = (
+                    tuple(sorted(keywords)),
+                    tuple(sorted(selected_types)),
+                    location_pref,
+                    time_frame,
+                    max_results,
+                    keywords,
+                    selected_types
+                )
+                if force_refresh:
+                    # Drop only this search's cached entry
+                    cached_search.clear(*search_args)
+                response = cached_search(*search_args)
                 
                 # Store in session state
                 st.session_state["search_response"] = response
+                st.session_state["search_response_id"] = uuid.uuid4().hex
                 st.session_state["search_keywords"] = keywords
                 
                 st.success(f"✅ Found {len(response.get('opportunities', []))} opportunities!")
@@ -446,89 +595,11 @@ def main():
     
     # Display results
     if "search_response" in st.session_state:
-        response = st.session_state["search_response"]
-        opportunities_data = response.get("opportunities", [])
-        metadata = response.get("search_metadata", {})
-        
-        st.divider()
-        st.header(f"📋 Results ({len(opportunities_data)} opportunities)")
-        
-        # Download button
-        if opportunities_data:
-            col1, col2, col3 = st.columns([1, 2, 1])
-            with col2:
-                json_data = convert_to_json(opportunities_data, metadata)
-                st.download_button(
-                    label="📥 Download Results as JSON",
-                    data=json_data,
-                    file_name=f"opportunities_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                    mime="application/json",
-                    use_container_width=True
-                )
-        
-        st.divider()
-        
-        # Filter and sort options
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            filter_paid = st.selectbox(
-                "💰 Compensation",
-                options=["all", "paid", "unpaid"],
-                format_func=lambda x: {"all": "All", "paid": "Paid Only", "unpaid": "Unpaid Only"}[x]
-            )
-        
-        with col2:
-            filter_virtual = st.selectbox(
-                "📍 Format",
-                options=["all", "virtual", "in_person"],
-                format_func=lambda x: {"all": "All", "virtual": "Virtual Only", "in_person": "In-Person Only"}[x]
-            )
-        
-        with col3:
-            sort_by = st.selectbox(
-                "📊 Sort By",
-                options=["confidence", "date", "name"],
-                format_func=lambda x: {"confidence": "Confidence Score", "date": "Event Date", "name": "Event Name"}[x]
-            )
-        
-        # Parse opportunities
-        opportunities = [Opportunity.from_api_response(o) for o in opportunities_data]
-        
-        # Apply filters
-        if filter_paid == "paid":
-            opportunities = [o for o in opportunities if o.is_paid]
-        elif filter_paid == "unpaid":
-            opportunities = [o for o in opportunities if not o.is_paid]
-        
-        if filter_virtual == "virtual":
-            opportunities = [o for o in opportunities if o.is_virtual]
-        elif filter_virtual == "in_person":
-            opportunities = [o for o in opportunities if not o.is_virtual]
-        
-        # Apply sorting
-        if sort_by == "confidence":
-            opportunities.sort(key=lambda x: x.confidence_score, reverse=True)
-        elif sort_by == "date":
-            opportunities.sort(key=lambda x: x.start_date or "9999")
-        elif sort_by == "name":
-            opportunities.sort(key=lambda x: x.event_name.lower())
-        
-        # Display opportunities
-        if opportunities:
-            for i, opp in enumerate(opportunities, 1):
-                render_opportunity_card(opp, i)
-        else:
-            st.info("No opportunities match the current filters.")
+        render_results()
     
     # Footer
     st.divider()
-    st.markdown("""
-    <div style="text-align: center; color: #888; font-size: 0.9rem;">
-        <p>Opportunity Scout - AI-Powered Speaking Opportunity Finder</p>
-        <p>💡 Tip: Download results as JSON to use with Proposal Architect</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(APP_FOOTER_HTML, unsafe_allow_html=True)
 
 
 if __name__ == "__main__":
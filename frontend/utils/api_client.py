@@ -6,16 +6,55 @@ including authentication, request formatting, and error handling.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import logging
 from typing import List, Optional, Dict, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def json_loads(data):
+    """Parse JSON from bytes or str, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def parse_scoring_response(content: bytes) -> Any:
+    """Decode a scoring response body, unwrapping it if Azure ML returned a JSON-encoded string."""
+    result = json_loads(content)
+    if isinstance(result, str):
+        result = json_loads(result)
+    return result
+
+
+def create_http_session() -> requests.Session:
+    """Create a pooled keep-alive session shared by all calls of one client."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504]
+        )
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 @dataclass
 class SearchRequest:
     """Request model for opportunity search."""
@@ -26,7 +65,7 @@ class SearchRequest:
     max_results: int = 20
 
 
-@dataclass
+@dataclass(slots=True)
 class Opportunity:
     """Simplified opportunity model for frontend display."""
     id: str
@@ -46,14 +85,19 @@ class Opportunity:
     source_url: Optional[str]
     confidence_score: float
     keywords_matched: List[str]
+    name_lower: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Lowercased once so name sorts don't redo it per sort
+        self.name_lower = (self.event_name or "").lower()
     
     @classmethod
     def from_api_response(cls, data: Dict[str, Any]) -> "Opportunity":
         """Create Opportunity from API response dictionary."""
-        dates = data.get("dates", {})
-        location = data.get("location", {})
-        compensation = data.get("compensation", {})
-        application = data.get("application", {})
+        dates = data.get("dates") or {}
+        location = data.get("location") or {}
+        compensation = data.get("compensation") or {}
+        application = data.get("application") or {}
         
         return cls(
             id=data.get("id", ""),
@@ -76,32 +120,49 @@ class Opportunity:
         )
 
 
+@dataclass(slots=True, frozen=True)
 class OpportunityScoutClient:
     """
     Client for the Opportunity Scout Azure ML endpoint.
+    
+    Args:
+        endpoint_url: Azure ML endpoint URL
+        api_key: API key for authentication
     """
+    endpoint_url: str
+    api_key: str = field(repr=False)
+    scoring_url: str = field(init=False)
+    _session: requests.Session = field(init=False, repr=False, compare=False)
+    _scoring_headers: Dict[str, str] = field(init=False, repr=False, compare=False)
     
-    def __init__(self, endpoint_url: str, api_key: str):
-        """
-        Initialize the client.
-        
-        Args:
-            endpoint_url: Azure ML endpoint URL
-            api_key: API key for authentication
-        """
-        self.endpoint_url = endpoint_url.rstrip('/')
-        self.api_key = api_key
+    def __post_init__(self):
+        # Frozen dataclass, so derived attributes are set through object.__setattr__
+        endpoint_url = self.endpoint_url.rstrip('/')
+        object.__setattr__(self, "endpoint_url", endpoint_url)
         
         # Construct the scoring URL
-        if not self.endpoint_url.endswith('/score'):
-            self.scoring_url = f"{self.endpoint_url}/score"
+        if not endpoint_url.endswith('/score'):
+            object.__setattr__(self, "scoring_url", f"{endpoint_url}/score")
         else:
-            self.scoring_url = self.endpoint_url
+            object.__setattr__(self, "scoring_url", endpoint_url)
+        
+        # Reuse one session so repeated calls keep the connection alive
+        session = create_http_session()
+        session.headers.update({
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.api_key}"
+        })
+        object.__setattr__(self, "_session", session)
+        # Only scoring calls are routed to a deployment
+        object.__setattr__(self, "_scoring_headers", {"azureml-model-deployment": "default"})
     
     def search(self, request: SearchRequest) -> Dict[str, Any]:
         """
         Search for speaking opportunities.
         
+        All keywords and opportunity types are sent together in a single
+        scoring request; the endpoint handles them in one call.
+        
         Args:
             request: SearchRequest with search parameters
         
@@ -111,12 +172,6 @@ class OpportunityScoutClient:
         Raises:
             Exception: If the API call fails
         """
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.api_key}",
-            "azureml-model-deployment": "default"
-        }
-        
         payload = {
             "keywords": request.keywords,
             "opportunity_types": request.opportunity_types,
@@ -129,20 +184,17 @@ class OpportunityScoutClient:
         logger.info(f"Keywords: {request.keywords}")
         
         try:
-            response = requests.post(
+            response = self._session.post(
                 self.scoring_url,
-                headers=headers,
+                headers=self._scoring_headers,
                 json=payload,
                 timeout=120  # 2 minute timeout for AI processing
             )
             
             response.raise_for_status()
             
-            result = response.json()
-            
-            # Handle string response (Azure ML sometimes wraps in string)
-            if isinstance(result, str):
-                result = json.loads(result)
+            # Azure ML sometimes wraps the body in a JSON string
+            result = parse_scoring_response(response.content)
             
             logger.info(f"Received {len(result.get('opportunities', []))} opportunities")
             
@@ -200,14 +252,8 @@ class OpportunityScoutClient:
         """
         try:
             # Try a minimal request
-            headers = {
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.api_key}"
-            }
-            
-            response = requests.get(
+            response = self._session.get(
                 self.endpoint_url,
-                headers=headers,
                 timeout=10
             )
             
@@ -0,0 +1,27 @@
+"""
+Input parsing helpers shared by the Streamlit frontends.
+"""
+
+import re
+import sys
+from datetime import datetime
+from typing import List
+
+KEYWORD_SPLIT_PATTERN = re.compile(r"[,\n]+")
+
+
+def parse_keywords(keywords_input: str) -> List[str]:
+    """Split comma/newline separated keywords, dropping blanks and duplicates."""
+    if not keywords_input:
+        return []
+    keywords = (kw.strip() for kw in KEYWORD_SPLIT_PATTERN.split(keywords_input))
+    return list(dict.fromkeys(kw for kw in keywords if kw))
+
+
+if sys.version_info >= (3, 11):
+    # fromisoformat accepts a trailing "Z" natively from 3.11 on
+    parse_iso_datetime = datetime.fromisoformat
+else:
+    def parse_iso_datetime(date_str: str) -> datetime:
+        """Parse an ISO 8601 timestamp, accepting a trailing "Z"."""
+        return datetime.fromisoformat(date_str.replace('Z', '+00:00'))
\ No newline at end of file